@@ -0,0 +1,278 @@
+"""Module to create Jira stories within an epic with asyncio."""
+
+# pylint: disable=logging-too-many-args
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from src.epic_manager import (
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    JiraEpic,
+)
+from src.exceptions import StoryCreationError
+from src.logging_config import setup_logger
+from src.utils import json_dumps
+
+logger = setup_logger(name="jira_epic")
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.schema import Story, Task
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Return how long to wait before retrying a rate limited request.
+
+    Parameters
+    ----------
+    response : aiohttp.ClientResponse
+        The rate limited response.
+    attempt : int
+        Number of retries already made.
+
+    Returns
+    -------
+    float
+        The ``Retry-After`` delay in seconds if Jira sent one,
+        an exponential backoff otherwise.
+
+    """
+    try:
+        return max(float(response.headers["Retry-After"]), 0)
+    except (KeyError, ValueError):
+        return RETRY_BACKOFF_FACTOR * 2**attempt
+
+
+class AsyncJiraEpic(JiraEpic):
+    """Class to create Jira issues within an epic concurrently.
+
+    Stories and their sub-tasks are created on a single event loop,
+    sharing one HTTP session whose connections are limited to
+    ``jira_concurrency``.
+    """
+
+    @property
+    def issue_url(self) -> str:
+        """Return the URL used to create issues."""
+        return f"{self.config.jira_url}rest/api/2/issue"
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session used to call Jira."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.config.jira_concurrency),
+            auth=aiohttp.BasicAuth(self.config.jira_email, self.config.jira_token),
+            json_serialize=json_dumps,
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=CONNECT_TIMEOUT,
+                sock_read=READ_TIMEOUT,
+            ),
+        )
+
+    async def _post_issue(self, session: aiohttp.ClientSession, fields: dict) -> str:
+        """Create an issue and return its key.
+
+        Rate limited requests are retried up to ``RETRY_TOTAL`` times,
+        honouring Jira's ``Retry-After`` header, like the sync client.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            HTTP session used to call Jira.
+        fields : dict
+            Issue fields dictionary.
+
+        Returns
+        -------
+        str
+            The issue key of the created issue.
+
+        """
+        attempt = 0
+        while True:
+            async with session.post(
+                self.issue_url,
+                json={"fields": fields},
+            ) as response:
+                if response.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                    response.raise_for_status()
+                    data = await response.json()
+                    return data["key"]
+                delay = _retry_delay(response, attempt)
+            attempt += 1
+            logger.warning(
+                "Jira answered %d, retrying in %.1fs (%d/%d)",
+                response.status,
+                delay,
+                attempt,
+                RETRY_TOTAL,
+            )
+            await asyncio.sleep(delay)
+
+    async def acreate_story_within_epic(
+        self,
+        session: aiohttp.ClientSession,
+        story: Story,
+    ) -> str:
+        """Create a story within the epic and return the issue key.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            HTTP session used to call Jira.
+        story : Story
+            Story to be created.
+
+        Returns
+        -------
+        str
+            The issue key of the created story.
+
+        """
+        fields = self._build_story_fields(story)
+        try:
+            issue_key = await self._post_issue(session, fields)
+        except aiohttp.ClientError as e:
+            logger.exception("Failed to create story %s", story.summary)
+            raise StoryCreationError(story.summary, original_error=e) from e
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Unexpected error creating story %s", story.summary)
+            raise StoryCreationError(story.summary) from e
+        logger.info("Created story '%s' with key %s", story.summary, issue_key)
+        return issue_key
+
+    async def acreate_sub_tasks_in_story(
+        self,
+        session: aiohttp.ClientSession,
+        all_tasks: Sequence[Task],
+        parent_key: str,
+    ) -> None:
+        """Create sub-tasks concurrently into a story.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            HTTP session used to call Jira.
+        all_tasks : Sequence[Task]
+            List of tasks to be created.
+        parent_key : str
+            The issue key of the story.
+
+        Returns
+        -------
+        None
+
+        """
+        field_list = [
+            self._build_sub_task_fields(task, parent_key) for task in all_tasks
+        ]
+        results = await asyncio.gather(
+            *[self._post_issue(session, fields) for fields in field_list],
+            return_exceptions=True,
+        )
+        failed_tasks = []
+        for task, result in zip(all_tasks, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to create sub-task %s: %s",
+                    task.summary,
+                    result,
+                )
+                failed_tasks.append(task.summary)
+            else:
+                logger.info(
+                    "Created sub-task '%s' with key %s under %s",
+                    task.summary,
+                    result,
+                    parent_key,
+                )
+        self._log_failed_tasks(failed_tasks, len(all_tasks), parent_key)
+
+    async def acreate_story_with_sub_tasks(
+        self,
+        session: aiohttp.ClientSession,
+        story: Story,
+    ) -> str | None:
+        """Create a story with sub-tasks.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            HTTP session used to call Jira.
+        story : Story
+            Story to be created.
+
+        Returns
+        -------
+        str | None
+            The issue key of the created story
+            or None if the story could not be created.
+
+        """
+        try:
+            parent_key = await self.acreate_story_within_epic(session, story)
+            if not story.tasks:
+                logger.warning("No tasks found for story %s", story.summary)
+                return parent_key
+            await self.acreate_sub_tasks_in_story(session, story.tasks, parent_key)
+        except StoryCreationError:
+            logger.exception("The story was not created.")
+            return None
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Unexpected error creating story %s", story.summary)
+            return None
+        return parent_key
+
+    async def acreate_stories(self, stories: list[Story]) -> dict[str, str | None]:
+        """Create stories with sub-tasks concurrently.
+
+        All stories and sub-tasks are created through a single HTTP
+        session, closed once every story is done.
+
+        Parameters
+        ----------
+        stories : list[Story]
+            Stories to be created.
+
+        Returns
+        -------
+        dict[str, str | None]
+            A dictionary mapping story summaries to issue keys.
+
+        """
+        async with self._create_session() as session:
+            issue_keys = await asyncio.gather(
+                *[
+                    self.acreate_story_with_sub_tasks(session, story)
+                    for story in stories
+                ],
+            )
+        results = {
+            story.summary: issue_key
+            for story, issue_key in zip(stories, issue_keys, strict=True)
+        }
+        self._log_created_stories(results, len(stories))
+        return results
+
+    def create_stories(self, stories: list[Story]) -> dict[str, str | None]:
+        """Create stories with sub-tasks on a new event loop.
+
+        Parameters
+        ----------
+        stories : list[Story]
+            Stories to be created.
+
+        Returns
+        -------
+        dict[str, str | None]
+            A dictionary mapping story summaries to issue keys.
+
+        """
+        return asyncio.run(self.acreate_stories(stories))
@@ -5,15 +5,14 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Self
 
 from dotenv import load_dotenv
-from pydantic import model_validator
+from pydantic import PositiveInt, model_validator
 from pydantic_settings import BaseSettings
 
 from src.exceptions import JiraEpicProjectMismatchError
 
-load_dotenv()
-
 
 class Config(BaseSettings):
     """Configuration for the application."""
@@ -24,6 +23,7 @@ class Config(BaseSettings):
     jira_token: str
     jira_host: str
     jira_id: str
+    jira_concurrency: PositiveInt = 8
 
     @property
     def jira_url(self) -> str:
@@ -31,14 +31,14 @@ class Config(BaseSettings):
         return f"https://{self.jira_host}/"
 
     @model_validator(mode="after")
-    def validate_project_and_epic_key(self) -> None:
+    def validate_project_and_epic_key(self) -> Self:
         """Validate that the epic key matches the project key."""
-        epic_key_prefix = self.jira_epic_key.split("-")[0]
-        if epic_key_prefix != self.jira_project:
+        if not self.jira_epic_key.startswith(f"{self.jira_project}-"):
             raise JiraEpicProjectMismatchError(
                 epic_key=self.jira_epic_key,
                 project_key=self.jira_project,
             )
+        return self
 
     class Config:
         """Pydantic configuration."""
@@ -47,7 +47,14 @@ class Config(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache
+def _load_env() -> None:
+    """Load the environment variables from the .env file once."""
+    load_dotenv()
+
+
 @lru_cache
 def get_settings() -> Config:
     """Return the settings."""
+    _load_env()
     return Config()
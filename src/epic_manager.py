@@ -1,12 +1,11 @@
 """Module to create Jira stories within an epic."""
 
 # pylint: disable=too-many-positional-arguments, logging-too-many-args
+# pylint: disable=import-outside-toplevel
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from atlassian import Jira
-from requests import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ClassVar
 
 from src.config import get_settings
 from src.exceptions import JiraEpicNotFoundError, StoryCreationError
@@ -14,44 +13,141 @@ from src.logging_config import setup_logger
 
 logger = setup_logger(name="jira_epic")
 
+# Maximum number of issues accepted by a single Jira bulk create request.
+_BULK_CREATE_LIMIT = 50
+
+# Connect and read timeouts, in seconds, of requests sent to Jira.
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30
+
+# Retry policy of requests answered with a rate limiting status.
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 503)
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from atlassian import Jira
+    from requests import Response
+
     from src.schema import Story, Task
 
 
+def _bulk_create_errors(response: Response | None) -> list[dict]:
+    """Return the per-item errors of a failed bulk create response.
+
+    Parameters
+    ----------
+    response : Response | None
+        The HTTP response of the bulk create request, if any.
+
+    Returns
+    -------
+    list[dict]
+        The ``errors`` array of the response body, or an empty list if
+        the body doesn't have one.
+
+    """
+    if response is None:
+        return []
+    try:
+        body = response.json()
+    except ValueError:
+        return []
+    errors = body.get("errors") if isinstance(body, dict) else None
+    return errors if isinstance(errors, list) else []
+
+
 class JiraEpic:
     """Class to create Jira issues within an epic."""
 
+    # (host, epic key) pairs already verified in this process.
+    _verified_epics: ClassVar[set[tuple[str, str]]] = set()
+
     def __init__(self) -> None:
         """Set up the Jira client."""
         self.config = get_settings()
+        # Field values shared by every issue payload, only serialized to JSON.
+        self._project_field = {"key": self.config.jira_project}
+        self._issue_type_fields: dict[str, dict[str, str]] = {}
+        self._default_assignee_field = {"id": self.config.jira_id}
         self.jira = self.set_up_client()
         self._verify_epic_exists()
 
     def set_up_client(self) -> Jira:
-        """Set up Jira client."""
-        return Jira(
+        """Set up Jira client.
+
+        The connection pool is sized to the number of concurrent workers
+        used by ``create_stories`` so that connections are reused.
+        Connection errors and rate limiting responses are retried with
+        backoff; other errors are not, as a retried POST could create
+        duplicate issues.
+        Requests time out after ``CONNECT_TIMEOUT`` seconds when connecting
+        and ``READ_TIMEOUT`` seconds when waiting for a response.
+        Request payloads are serialized with orjson.
+        The Jira client is imported here as it is slow to import.
+        """
+        from requests.adapters import HTTPAdapter  # noqa: PLC0415
+        from urllib3.util import Retry  # noqa: PLC0415
+
+        from src.jira_client import OrjsonJira  # noqa: PLC0415
+
+        jira = OrjsonJira(
             url=self.config.jira_url,
             username=self.config.jira_email,
             password=self.config.jira_token,
         )
+        # The constructor only accepts a single integer timeout.
+        jira.timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)  # type: ignore[assignment]
+        adapter = HTTPAdapter(
+            pool_connections=self.config.jira_concurrency,
+            pool_maxsize=self.config.jira_concurrency,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                read=False,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False,
+            ),
+        )
+        jira._session.mount(  # pylint: disable=protected-access  # noqa: SLF001
+            self.config.jira_url,
+            adapter,
+        )
+        return jira
 
     def _verify_epic_exists(self) -> None:
         """Verify that the configured epic exists.
 
+        The check is only done once per host and epic key.
+
         Raises
         ------
         JiraEpicNotFoundError
-            If the epic doesn't exist.
+            If the epic doesn't exist or Jira didn't answer in time.
 
         """
+        from requests.exceptions import Timeout  # noqa: PLC0415
+
+        epic = (self.config.jira_host, self.config.jira_epic_key)
+        if epic in self._verified_epics:
+            return
         try:
             self.jira.issue(self.config.jira_epic_key)
             logger.info("Verified epic %s exists", self.config.jira_epic_key)
+        except Timeout as e:
+            raise JiraEpicNotFoundError(
+                self.config.jira_epic_key,
+                reason=f"request to {self.config.jira_host} timed out",
+            ) from e
         except Exception as e:
             raise JiraEpicNotFoundError(self.config.jira_epic_key) from e
+        self._verified_epics.add(epic)
 
-    def _get_assignee_id(self, assignee_id: str | None) -> str:
-        """Get assignee ID, falling back to default from config.
+    def _get_assignee_field(self, assignee_id: str | None) -> dict[str, str]:
+        """Get assignee field, falling back to default from config.
 
         Parameters
         ----------
@@ -60,11 +156,13 @@ class JiraEpic:
 
         Returns
         -------
-        str
-            The assignee ID to use.
+        dict[str, str]
+            The assignee field to use.
 
         """
-        return assignee_id or self.config.jira_id
+        if assignee_id:
+            return {"id": assignee_id}
+        return self._default_assignee_field
 
     def _build_issue_fields(  # pylint: disable=too-many-arguments
         self,
@@ -95,17 +193,21 @@ class JiraEpic:
             Issue fields dictionary.
 
         """
+        issue_type_field = self._issue_type_fields.get(issue_type)
+        if issue_type_field is None:
+            issue_type_field = {"name": issue_type}
+            self._issue_type_fields[issue_type] = issue_type_field
         return {
-            "project": {"key": self.config.jira_project},
+            "project": self._project_field,
             "summary": summary,
             "description": description,
-            "issuetype": {"name": issue_type},
+            "issuetype": issue_type_field,
             "parent": {"key": parent_key},
-            "assignee": {"id": self._get_assignee_id(assignee_id)},
+            "assignee": self._get_assignee_field(assignee_id),
         }
 
-    def create_story_within_epic(self, story: Story) -> str:
-        """Create a story for a market and return the issue key.
+    def _build_story_fields(self, story: Story) -> dict:
+        """Build the issue fields of a story within the epic.
 
         Parameters
         ----------
@@ -114,18 +216,60 @@ class JiraEpic:
 
         Returns
         -------
-        str | None
-            The issue key of the created story
-            or None if the story could not be created.
+        dict
+            Issue fields dictionary.
 
         """
-        fields = self._build_issue_fields(
+        return self._build_issue_fields(
             summary=story.summary,
             description=story.description,
             issue_type="Story",
             parent_key=self.config.jira_epic_key,
             assignee_id=story.assignee_id,
         )
+
+    def _build_sub_task_fields(self, task: Task, parent_key: str) -> dict:
+        """Build the issue fields of a sub-task within a story.
+
+        Parameters
+        ----------
+        task : Task
+            Task to be created.
+        parent_key : str
+            The issue key of the story.
+
+        Returns
+        -------
+        dict
+            Issue fields dictionary.
+
+        """
+        return self._build_issue_fields(
+            summary=task.summary,
+            description=task.description,
+            issue_type="Sub-task",
+            parent_key=parent_key,
+            assignee_id=task.assignee_id,
+        )
+
+    def create_story_within_epic(self, story: Story) -> str:
+        """Create a story for a market and return the issue key.
+
+        Parameters
+        ----------
+        story : Story
+            Story to be created.
+
+        Returns
+        -------
+        str | None
+            The issue key of the created story
+            or None if the story could not be created.
+
+        """
+        from requests import HTTPError  # noqa: PLC0415
+
+        fields = self._build_story_fields(story)
         try:
             response = self.jira.create_issue(fields=fields)
             logger.info(
@@ -151,14 +295,17 @@ class JiraEpic:
 
     def create_sub_tasks_in_story(
         self,
-        all_tasks: list[Task],
+        all_tasks: Sequence[Task],
         parent_key: str,
     ) -> None:
         """Create sub-tasks from a dictionary into a story.
 
+        Sub-tasks are sent to Jira's bulk create endpoint, in batches of
+        at most ``_BULK_CREATE_LIMIT`` issues.
+
         Parameters
         ----------
-        all_tasks : list[Task]
+        all_tasks : Sequence[Task]
             List of tasks to be created.
         parent_key : str
             The issue key of the story.
@@ -169,39 +316,122 @@ class JiraEpic:
 
         """
         failed_tasks = []
-        for task in all_tasks:
-            fields = self._build_issue_fields(
-                summary=task.summary,
-                description=task.description,
-                issue_type="Sub-task",
-                parent_key=parent_key,
-                assignee_id=task.assignee_id,
-            )
-            try:
-                response = self.jira.create_issue(fields=fields)
-                logger.info(
-                    "Created sub-task '%s' with key %s under %s",
-                    task.summary,
-                    response["key"],
-                    parent_key,
-                )
-            except HTTPError:
-                logger.exception("Failed to create sub-task %s", task.summary)
-                failed_tasks.append(task.summary)
-            except Exception:  # pylint: disable=broad-exception-caught
-                logger.exception(
-                    "Unexpected error creating sub-task %s",
-                    task.summary,
-                )
-                failed_tasks.append(task.summary)
+        for start in range(0, len(all_tasks), _BULK_CREATE_LIMIT):
+            batch = all_tasks[start : start + _BULK_CREATE_LIMIT]
+            failed_tasks.extend(self._create_sub_task_batch(batch, parent_key))
+        self._log_failed_tasks(failed_tasks, len(all_tasks), parent_key)
+
+    @staticmethod
+    def _log_failed_tasks(
+        failed_tasks: list[str],
+        task_count: int,
+        parent_key: str,
+    ) -> None:
+        """Log how many sub-tasks of a story could not be created.
+
+        Parameters
+        ----------
+        failed_tasks : list[str]
+            Summaries of the tasks that could not be created.
+        task_count : int
+            Number of tasks that were submitted.
+        parent_key : str
+            The issue key of the story.
+
+        """
         if failed_tasks:
             logger.warning(
                 "Failed to create %d/%d tasks for %s",
                 len(failed_tasks),
-                len(all_tasks),
+                task_count,
                 parent_key,
             )
 
+    def _create_sub_task_batch(
+        self,
+        tasks: Sequence[Task],
+        parent_key: str,
+    ) -> list[str]:
+        """Create a batch of sub-tasks with a single bulk request.
+
+        Parameters
+        ----------
+        tasks : Sequence[Task]
+            Tasks to be created, at most ``_BULK_CREATE_LIMIT`` of them.
+        parent_key : str
+            The issue key of the story.
+
+        Returns
+        -------
+        list[str]
+            Summaries of the tasks that could not be created.
+
+        """
+        from requests import HTTPError  # noqa: PLC0415
+
+        field_list = [
+            {"fields": self._build_sub_task_fields(task, parent_key)} for task in tasks
+        ]
+        try:
+            response = self.jira.create_issues(field_list)
+        except HTTPError as e:
+            # Jira answers with an error status only when no issue was created.
+            logger.exception("Failed to create sub-tasks under %s", parent_key)
+            self._log_sub_task_errors(tasks, _bulk_create_errors(e.response))
+            return [task.summary for task in tasks]
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception(
+                "Unexpected error creating sub-tasks under %s",
+                parent_key,
+            )
+            return [task.summary for task in tasks]
+
+        failed_indexes = self._log_sub_task_errors(tasks, response.get("errors", []))
+        # Created issues are returned in request order, without the failed ones.
+        created_tasks = [
+            task for index, task in enumerate(tasks) if index not in failed_indexes
+        ]
+        for task, issue in zip(created_tasks, response.get("issues", []), strict=False):
+            logger.info(
+                "Created sub-task '%s' with key %s under %s",
+                task.summary,
+                issue["key"],
+                parent_key,
+            )
+        return [tasks[index].summary for index in sorted(failed_indexes)]
+
+    @staticmethod
+    def _log_sub_task_errors(tasks: Sequence[Task], errors: list[dict]) -> set[int]:
+        """Log the per-item errors of a bulk create request.
+
+        Parameters
+        ----------
+        tasks : Sequence[Task]
+            Tasks sent in the bulk create request.
+        errors : list[dict]
+            The ``errors`` array of Jira's bulk create response.
+
+        Returns
+        -------
+        set[int]
+            Indexes, in ``tasks``, of the tasks that could not be created.
+            Errors not pointing to one of the tasks are logged and skipped.
+
+        """
+        failed_indexes = set()
+        for error in errors:
+            index = error.get("failedElementNumber") if isinstance(error, dict) else -1
+            if not isinstance(index, int) or not 0 <= index < len(tasks):
+                logger.error("Unexpected bulk create error: %s", error)
+                continue
+            failed_indexes.add(index)
+            logger.error(
+                "Failed to create sub-task %s: %s",
+                tasks[index].summary,
+                error.get("elementErrors"),
+            )
+        return failed_indexes
+
     def create_story_with_sub_tasks(self, story: Story) -> str | None:
         """Create a story with sub-tasks.
 
@@ -245,6 +475,8 @@ class JiraEpic:
 
         Create stories and return the issue keys.
         Create sub-tasks for the stories.
+        Stories are created concurrently, using at most
+        ``jira_concurrency`` workers.
 
         Parameters
         ----------
@@ -257,15 +489,36 @@ class JiraEpic:
             A dictionary mapping story summaries to issue keys.
 
         """
-        results = {}
-        for story in stories:
-            issue_key = self.create_story_with_sub_tasks(story)
-            results[story.summary] = issue_key
+        with ThreadPoolExecutor(max_workers=self.config.jira_concurrency) as executor:
+            results = {
+                story.summary: issue_key
+                for story, issue_key in zip(
+                    stories,
+                    executor.map(self.create_story_with_sub_tasks, stories),
+                    strict=True,
+                )
+            }
+        self._log_created_stories(results, len(stories))
+        return results
+
+    @staticmethod
+    def _log_created_stories(
+        results: dict[str, str | None],
+        story_count: int,
+    ) -> None:
+        """Log how many stories were created successfully.
 
+        Parameters
+        ----------
+        results : dict[str, str | None]
+            A dictionary mapping story summaries to issue keys.
+        story_count : int
+            Number of stories that were submitted.
+
+        """
         success_count = sum(1 for key in results.values() if key is not None)
         logger.info(
             "Created %d/%d stories successfully",
             success_count,
-            len(stories),
+            story_count,
         )
-        return results
@@ -35,11 +35,16 @@ class JiraProjectNotFoundError(JiraError):
 class JiraEpicNotFoundError(JiraError):
     """Raised when the specified epic doesn't exist."""
 
-    def __init__(self, epic_key: str) -> None:
+    def __init__(self, epic_key: str, reason: str | None = None) -> None:
         """Initialize the exception."""
         message = f"Jira epic not found: {epic_key}"
-        super().__init__(message, {"epic_key": epic_key})
+        details = {"epic_key": epic_key}
+        if reason:
+            details["reason"] = reason
+            message = f"{message} - {reason}"
+        super().__init__(message, details)
         self.epic_key = epic_key
+        self.reason = reason
 
 
 class JiraEpicProjectMismatchError(JiraError):
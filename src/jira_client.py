@@ -0,0 +1,87 @@
+"""Jira client module."""
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import orjson
+from atlassian import Jira, rest_client
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+class OrjsonJira(Jira):
+    """Jira client serializing request payloads with orjson.
+
+    Only instances of this class are affected, other atlassian clients
+    keep the standard library serializer.
+    """
+
+    def request(  # noqa: PLR0913, PLR0917
+        self,
+        method: str = "GET",
+        path: str = "/",
+        data: dict | str | bool | None = None,  # noqa: FBT001
+        json: dict | str | None = None,
+        flags: list | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+        files: dict | None = None,
+        trailing: bool | None = None,  # noqa: FBT001
+        absolute: bool = False,  # noqa: FBT001, FBT002
+        advanced_mode: bool = False,  # noqa: FBT001, FBT002
+        allow_redirects: bool = True,  # noqa: FBT001, FBT002
+    ) -> Response:
+        """Send a request, serializing its payload with orjson.
+
+        ``Jira.request`` serializes ``data`` with ``json.dumps`` unless
+        ``files`` is given, so the serialized payload is passed along with
+        an empty ``files`` mapping, which requests doesn't send.
+        Payloads orjson can't serialize are left to ``Jira.request``.
+        ``allow_redirects`` is only forwarded when disabled, as older
+        atlassian releases don't accept it.
+        """
+        if files is None and data:
+            try:
+                payload = orjson.dumps(data)  # pylint: disable=no-member
+            except orjson.JSONEncodeError:  # pylint: disable=no-member
+                pass
+            else:
+                data, files = payload, {}  # type: ignore[assignment]
+        extra = {} if allow_redirects else {"allow_redirects": False}
+        return super().request(
+            method,
+            path,
+            data,
+            json,
+            flags,
+            params,
+            headers,
+            files,
+            trailing,
+            absolute,
+            advanced_mode,
+            **extra,
+        )
+
+    def log_curl_debug(
+        self,
+        method: str,
+        url: str,
+        data: dict | str | bool | bytes | None = None,  # noqa: FBT001
+        headers: dict | None = None,
+        level: int = logging.DEBUG,
+    ) -> None:
+        """Log the request as a curl command if the level is enabled.
+
+        ``Jira.log_curl_debug`` serializes ``data`` on every request
+        and can't serialize the bytes sent by ``request``.
+        """
+        if not rest_client.log.isEnabledFor(level):
+            return
+        if isinstance(data, bytes):
+            data = data.decode()
+        super().log_curl_debug(method, url, data=data, headers=headers, level=level)
@@ -1,14 +1,21 @@
 """Logging configuration module."""
 
 import logging
+import sys
+from functools import lru_cache
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+
+@lru_cache
 def setup_logger(
     name: str = "lambda_logger",
     level: int = logging.INFO,
 ) -> logging.Logger:
     """Set up and return a standardized logger.
 
+    Loggers are cached, so each name and level is only configured once.
+
     Parameters
     ----------
     name: str
@@ -24,10 +31,8 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
     if not logger.hasHandlers():  # Avoid duplicate handlers
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        handler = logging.StreamHandler(sys.stderr)
+        formatter = logging.Formatter(LOG_FORMAT)
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     logger.setLevel(level)
@@ -1,20 +1,19 @@
 """Schema module."""
 
+# pylint: disable=import-outside-toplevel
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from pathlib import Path
 
-from pydantic import BaseModel, Field
-
-from src.utils import load_json
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Task(BaseModel):
     """Task model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     summary: str = Field(..., title="Summary")
     description: str = Field(..., title="Description")
     assignee_id: str | None = Field(None, title="Assignee ID")
@@ -23,13 +22,32 @@ class Task(BaseModel):
 class Story(BaseModel):
     """Story model."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     summary: str = Field(..., title="Summary")
     description: str = Field(..., title="Description")
-    tasks: list[Task] | None = Field(..., title="Tasks")
+    tasks: tuple[Task, ...] | None = Field(..., title="Tasks")
     assignee_id: str | None = Field(None, title="Assignee ID")
 
     @classmethod
     def from_json_file(cls, filepath: str | Path) -> Story:
-        """Load a Story from a JSON file."""
-        data = load_json(filepath)
-        return cls.model_validate(data)
+        """Load a Story from a JSON file.
+
+        Stories are cached until the file is modified. The cached story
+        is shared between callers, hence its tasks being a tuple.
+        """
+        path = Path(filepath).resolve()
+        return _load_story_cached(cls, path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _load_story_cached(
+    story_cls: type[Story],
+    filepath: Path,
+    mtime_ns: int,  # noqa: ARG001  # pylint: disable=unused-argument
+) -> Story:
+    """Load and validate a Story, cached by path and modification time."""
+    from src.utils import load_json  # noqa: PLC0415
+
+    data = load_json(filepath)
+    return story_cls.model_validate(data)
@@ -1,12 +1,17 @@
 """Utils module."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
+
 
 def load_json(file_path: str | Path) -> dict:
     """Load a JSON file."""
     filepath = Path(file_path) if isinstance(file_path, str) else file_path
-    with filepath.open(encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(filepath.read_bytes())  # pylint: disable=no-member
+
+
+def json_dumps(obj: object) -> str:
+    """Serialize an object to a JSON string."""
+    return orjson.dumps(obj).decode()  # pylint: disable=no-member